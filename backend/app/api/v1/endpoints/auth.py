@@ -3,7 +3,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
 import pyotp
 import qrcode
 import io
@@ -34,7 +34,7 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         if username is None:
             raise credentials_exception
         # Check token expiration is handled by jwt.decode automatically
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
     
     user = db.query(User).filter(User.username == username).first()
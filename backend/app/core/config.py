@@ -39,6 +39,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str = ""  # Will be validated
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60  # 1 hour (reduced from 24 for security)
+    BCRYPT_ROUNDS: int = 12  # Work factor; tests lower this via pytest.ini
     
     # Market Data
     LUSE_DATA_URL: str = "https://afx.kwayisi.org/luse/"
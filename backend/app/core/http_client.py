@@ -0,0 +1,29 @@
+"""
+Outbound HTTP helpers shared by the data pipelines.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_retry_session(total: int = 5, backoff_factor: float = 2.0) -> requests.Session:
+    """Build a requests Session that backs off on 429/5xx responses.
+
+    Honours the server's Retry-After header when present. Otherwise urllib3
+    retries the first failure immediately and sleeps
+    backoff_factor * 2**(n - 1) seconds before retry n >= 2 (capped at 120s),
+    i.e. 0, 4, 8, 16, 32s with the defaults. This blocks the calling thread,
+    so keep it to batch jobs rather than code running on the API event loop.
+    """
+    retry = Retry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -3,6 +3,7 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.core.config import settings
 from app.api.v1 import api_router
 import logging
@@ -94,6 +95,9 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],
 )
 
+# Compress larger responses (market summaries, PDF reports) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 from app.core.database import engine, Base
 
 # Create database tables
@@ -19,6 +19,7 @@ and error handling for production use.
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
 from scipy.optimize import newton
@@ -41,9 +42,12 @@ class TimeValueOfMoney:
     Core TVM engine with actuarial notation and robust error handling.
     """
     @staticmethod
+    @lru_cache(maxsize=1024)
     def discount_factor(i: float, n: float) -> float:
         """
         Calculate discount factor v^n = (1+i)^(-n)
+        Memoised on (i, n): inputs are hashable scalar rates/terms and the
+        result is a pure function of them, so cached values never go stale.
         Args:
             i (float): Interest rate
             n (float): Number of periods
@@ -55,9 +59,11 @@ class TimeValueOfMoney:
         return (1 + i) ** (-n)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def accumulation_factor(i: float, n: float) -> float:
         """
         Calculate accumulation factor (1+i)^n
+        Memoised on (i, n) like discount_factor.
         """
         if i < -1:
             raise ValueError("Interest rate must be greater than -100%.")
@@ -112,6 +118,15 @@ class AnnuityCalculator:
         d = TimeValueOfMoney.discount_rate(i)
         return (1 - v) / d
     
+    @staticmethod
+    def increasing_annuity_immediate(i: float, n: int) -> float:
+        """
+        Calculate PV of increasing annuity in arrears: (Ia)_n| = Σ t·v^t for t = 1..n
+        Summed directly: the closed form (ä_n| - n·v^n) / i cancels catastrophically as i -> 0.
+        """
+        t = np.arange(1, n + 1, dtype=float)
+        return float(np.sum(t * (1 + i) ** -t))
+    
     @staticmethod
     def perpetuity(i: float) -> float:
         """Calculate PV of perpetuity: a_∞| = 1/i"""
@@ -211,11 +226,10 @@ class BondPricer:
         coupon_payment = (coupon_rate / frequency) * face_value
         period_yield = yield_rate / frequency
         
-        weighted_pv = 0
-        for t in range(1, n_periods + 1):
-            time_years = t / frequency
-            pv = coupon_payment * TimeValueOfMoney.discount_factor(period_yield, t)
-            weighted_pv += time_years * pv
+        # Time-weighted PV of coupons: Σ (t/k)·C·v^t = C·(Ia)_n| / k
+        weighted_pv = coupon_payment * AnnuityCalculator.increasing_annuity_immediate(
+            period_yield, n_periods
+        ) / frequency
         
         # Add face value payment
         pv_face = face_value * TimeValueOfMoney.discount_factor(period_yield, n_periods)
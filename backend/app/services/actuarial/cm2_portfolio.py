@@ -13,6 +13,30 @@ from dataclasses import dataclass
 from scipy.optimize import minimize
 from scipy.stats import norm
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _neg_sharpe(w: np.ndarray, mu: np.ndarray, cov: np.ndarray, rf: float) -> float:
+    """Negative Sharpe ratio: -(w·μ - r_f) / sqrt(w'Σw)"""
+    return -(w @ mu - rf) / np.sqrt(w @ cov @ w)
+
+
+def _neg_sharpe_grad(w: np.ndarray, mu: np.ndarray, cov: np.ndarray, rf: float) -> np.ndarray:
+    """Analytic gradient of the negative Sharpe ratio with respect to w"""
+    cov_w = cov @ w
+    vol = np.sqrt(w @ cov_w)
+    excess = w @ mu - rf
+    return -(mu / vol - excess * cov_w / vol ** 3)
+
+
+if HAS_NUMBA:
+    _neg_sharpe = njit(fastmath=True, cache=True)(_neg_sharpe)
+    _neg_sharpe_grad = njit(fastmath=True, cache=True)(_neg_sharpe_grad)
+
 
 @dataclass
 class PortfolioMetrics:
@@ -134,17 +158,20 @@ class PortfolioOptimizer:
     
     def max_sharpe_ratio(self) -> PortfolioMetrics:
         """Maximize Sharpe ratio (Tangency Portfolio)"""
-        def neg_sharpe(weights):
-            ret, vol, sharpe = self.portfolio_performance(weights)
-            return -sharpe
+        # Hoist the statistics out of the objective as contiguous float arrays
+        mu = np.ascontiguousarray(self.mean_returns, dtype=np.float64)
+        cov = np.ascontiguousarray(self.cov_matrix, dtype=np.float64)
+        rf = float(self.risk_free_rate)
         
         cons = [{'type': 'eq', 'fun': lambda w: np.sum(w) - 1}]
         bounds = tuple((0, 1) for _ in range(self.n_assets))
         init_weights = np.array([1/self.n_assets] * self.n_assets)
         
         result = minimize(
-            neg_sharpe,
+            _neg_sharpe,
             init_weights,
+            args=(mu, cov, rf),
+            jac=_neg_sharpe_grad,
             method='SLSQP',
             bounds=bounds,
             constraints=cons
@@ -13,6 +13,7 @@ Designed for LuSE market characteristics:
 """
 
 import logging
+from operator import attrgetter
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Tuple, Dict, Any
 
@@ -26,6 +27,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.price_history import PriceHistory
 from app.models.asset import Asset
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,22 +94,79 @@ def convert_prices_to_dataframe(
     if not prices:
         return pd.DataFrame(columns=["close"])
     
-    data = [
-        {
-            "date": getattr(p, date_column),
-            "close": getattr(p, price_column)
-        }
-        for p in prices
-    ]
+    # Build one contiguous array per column rather than a list of row dicts
+    get_date = attrgetter(date_column)
+    get_price = attrgetter(price_column)
+    dates = np.fromiter(
+        (get_date(p) for p in prices), dtype="datetime64[ns]", count=len(prices)
+    )
+    closes = np.fromiter(
+        (get_price(p) for p in prices), dtype=np.float64, count=len(prices)
+    )
     
-    df = pd.DataFrame(data)
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.set_index("date").sort_index()
+    df = pd.DataFrame(
+        {"close": closes},
+        index=pd.DatetimeIndex(dates, name="date")
+    ).sort_index()
     
     logger.debug(f"Converted {len(prices)} price records to DataFrame")
     return df
 
 
+def _weekly_log_returns_kernel(days: np.ndarray, prices: np.ndarray) -> np.ndarray:
+    """Single-pass weekly (W-SUN) last-price log returns.
+    
+    Args:
+        days: Sorted int64 days since the Unix epoch
+        prices: float64 prices aligned with ``days`` (NaN is forward-filled)
+        
+    Returns:
+        Log returns per calendar week from the first to the last observed
+        week; weeks without observations (and the week after) are NaN,
+        matching ``resample("W").last()`` followed by ``log(p / p.shift(1))``.
+    """
+    n = days.shape[0]
+    # 1970-01-01 was a Thursday, so (day + 3) // 7 buckets Monday..Sunday
+    first_week = (days[0] + 3) // 7
+    n_weeks = (days[n - 1] + 3) // 7 - first_week + 1
+    
+    weekly = np.full(n_weeks, np.nan)
+    last = np.nan
+    for i in range(n):
+        if not np.isnan(prices[i]):
+            last = prices[i]
+        weekly[(days[i] + 3) // 7 - first_week] = last
+    
+    out = np.empty(n_weeks)
+    out[0] = np.nan
+    for w in range(1, n_weeks):
+        out[w] = np.log(weekly[w] / weekly[w - 1])
+    return out
+
+
+if HAS_NUMBA:
+    _weekly_log_returns_kernel = njit(cache=True)(_weekly_log_returns_kernel)
+
+
+def _weekly_log_returns(close: pd.Series) -> pd.Series:
+    """Weekly log returns of a sorted price series via the compiled kernel."""
+    if close.empty:
+        return pd.Series(dtype=np.float64)
+    
+    days = close.index.values.astype("datetime64[D]").astype(np.int64)
+    prices = close.to_numpy(dtype=np.float64)
+    returns = _weekly_log_returns_kernel(days, prices)
+    
+    # Label each bucket with its closing Sunday, as resample("W") does
+    first_sunday = (days[0] + 3) // 7 * 7 + 3
+    labels = (first_sunday + 7 * np.arange(len(returns))).astype("datetime64[D]")
+    return pd.Series(
+        returns,
+        index=pd.DatetimeIndex(labels.astype("datetime64[ns]"), name=close.index.name),
+        name=close.name
+    )
+
+
 def prepare_returns_data(
     asset_df: pd.DataFrame,
     benchmark_df: pd.DataFrame,
@@ -124,17 +188,22 @@ def prepare_returns_data(
     Returns:
         Tuple of (asset_returns, benchmark_returns) as aligned Series
     """
-    # Forward-fill to handle trading gaps (LuSE illiquidity)
-    asset_filled = asset_df["close"].ffill()
-    benchmark_filled = benchmark_df["close"].ffill()
-    
-    # Resample to weekly (last price of the week)
-    asset_weekly = asset_filled.resample(resample_freq).last()
-    benchmark_weekly = benchmark_filled.resample(resample_freq).last()
-    
-    # Calculate logarithmic returns: log(P_t / P_t-1)
-    asset_returns = np.log(asset_weekly / asset_weekly.shift(1))
-    benchmark_returns = np.log(benchmark_weekly / benchmark_weekly.shift(1))
+    if HAS_NUMBA and resample_freq == "W":
+        # Compiled single pass: forward-fill, weekly last price, log returns
+        asset_returns = _weekly_log_returns(asset_df["close"])
+        benchmark_returns = _weekly_log_returns(benchmark_df["close"])
+    else:
+        # Forward-fill to handle trading gaps (LuSE illiquidity)
+        asset_filled = asset_df["close"].ffill()
+        benchmark_filled = benchmark_df["close"].ffill()
+        
+        # Resample to weekly (last price of the week)
+        asset_weekly = asset_filled.resample(resample_freq).last()
+        benchmark_weekly = benchmark_filled.resample(resample_freq).last()
+        
+        # Calculate logarithmic returns: log(P_t / P_t-1)
+        asset_returns = np.log(asset_weekly / asset_weekly.shift(1))
+        benchmark_returns = np.log(benchmark_weekly / benchmark_weekly.shift(1))
     
     # Align and drop NaN values
     combined = pd.concat(
@@ -160,6 +229,8 @@ def calculate_beta(
     
     Beta = Cov(R_asset, R_benchmark) / Var(R_benchmark)
     
+    Both series are aligned on their index and rows with NaN are dropped.
+    
     Args:
         asset_returns: Series of asset log returns
         benchmark_returns: Series of benchmark log returns
@@ -176,7 +247,18 @@ def calculate_beta(
             "INSUFFICIENT_DATA"
         )
     
-    benchmark_variance = benchmark_returns.var()
+    # Pair observations by index and drop NaN, as Series.cov does
+    paired = pd.concat([asset_returns, benchmark_returns], axis=1, join="inner").dropna()
+    if len(paired) < 2:
+        raise RiskCalculationError(
+            "Insufficient overlapping data points for beta calculation",
+            "INSUFFICIENT_DATA"
+        )
+    
+    # One fused pass over both columns for cov and var
+    cov_matrix = np.cov(paired.to_numpy(dtype=np.float64), rowvar=False, ddof=1)
+    covariance = cov_matrix[0, 1]
+    benchmark_variance = cov_matrix[1, 1]
     
     if benchmark_variance == 0 or np.isnan(benchmark_variance):
         raise RiskCalculationError(
@@ -184,7 +266,6 @@ def calculate_beta(
             "ZERO_VARIANCE"
         )
     
-    covariance = asset_returns.cov(benchmark_returns)
     beta = covariance / benchmark_variance
     
     logger.debug(f"Calculated beta: {beta:.4f} (cov={covariance:.6f}, var={benchmark_variance:.6f})")
@@ -212,8 +293,14 @@ def calculate_var_95(returns: pd.Series) -> float:
             "INSUFFICIENT_DATA"
         )
     
-    # 5th percentile of returns (left tail)
-    var_95 = float(np.percentile(returns, 5))
+    # 5th percentile of returns (left tail), linearly interpolated like
+    # np.percentile but via O(n) selection instead of a full sort
+    arr = returns.to_numpy(dtype=np.float64)
+    position = 0.05 * (len(arr) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(arr) - 1)
+    tail = np.partition(arr, [lower, upper])
+    var_95 = float(tail[lower] + (position - lower) * (tail[upper] - tail[lower]))
     
     # Convert to percentage
     var_95_pct = var_95 * 100
@@ -1,13 +1,17 @@
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
+import jwt
 from app.models.user import User
 from app.core.config import settings
 from sqlalchemy.orm import Session
 import re
 
 # Password hashing context - using bcrypt for better security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 # JWT settings from centralized config
 SECRET_KEY = settings.SECRET_KEY
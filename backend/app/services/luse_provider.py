@@ -122,7 +122,7 @@ class LUSEProvider(PriceProvider):
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.content, "lxml")
             text = soup.get_text()
             
             # Look for: "current share price of ... is ZMW XXX.XX"
@@ -23,6 +23,35 @@ class MarketDataService:
         self.db.commit()
         return sec
 
+    def create_tickers_bulk(self, securities: list[dict]) -> list[Security]:
+        """
+        Bulk variant of `create_ticker`: each dict holds its keyword arguments.
+        Tickers that already exist are skipped; the rest are added in one commit and returned.
+        """
+        if not securities:
+            return []
+
+        existing = {
+            ticker for (ticker,) in self.db.query(Security.ticker).filter(
+                Security.ticker.in_([s["ticker"] for s in securities])
+            ).all()
+        }
+
+        created = [
+            Security(
+                ticker=s["ticker"],
+                name=s["name"],
+                sector=s["sector"],
+                type=s.get("security_type", "Equity"),
+                maturity_date=s.get("maturity_date"),
+                coupon_rate=s.get("coupon_rate")
+            )
+            for s in securities if s["ticker"] not in existing
+        ]
+        self.db.add_all(created)
+        self.db.commit()
+        return created
+
     def ingest_price(self, ticker: str, price: float, volume: int, valid_date: date):
         """
         Ingests a new price. If a correction, it closes the old transaction interval.
@@ -52,6 +81,37 @@ class MarketDataService:
         self.db.commit()
         return new_price
 
+    def ingest_prices_bulk(self, prices: list[tuple[str, float, int]], valid_date: date):
+        """
+        Bulk variant of `ingest_price` for (ticker, price, volume) tuples sharing one valid_date.
+        Closes any open records for those tickers and inserts the new ones in a single transaction.
+        """
+        if not prices:
+            return
+
+        now = datetime.now()
+        tickers = [ticker for ticker, _, _ in prices]
+
+        self.db.query(MarketPrice).filter(
+            MarketPrice.security_ticker.in_(tickers),
+            MarketPrice.valid_from == valid_date,
+            MarketPrice.transaction_to == None
+        ).update({"transaction_to": now}, synchronize_session=False)
+
+        # Core executemany: no ORM unit-of-work bookkeeping per row
+        self.db.execute(MarketPrice.__table__.insert(), [
+            {
+                "security_ticker": ticker,
+                "price": price,
+                "volume": volume,
+                "valid_from": valid_date,
+                "transaction_from": now,
+                "transaction_to": None
+            }
+            for ticker, price, volume in prices
+        ])
+        self.db.commit()
+
     def get_price_as_of(self, ticker: str, valid_date: date, as_of_time: datetime = None):
         """
         Time Travel Query: What did we think the price was at `as_of_time`?
@@ -71,6 +131,22 @@ class MarketDataService:
              
         return query.first()
 
+    def get_prices_as_of_bulk(self, tickers: list[str], valid_date: date) -> dict[str, float]:
+        """
+        Current prices for many tickers on `valid_date` in one query, keyed by ticker.
+        Tickers without a price for that date are omitted.
+        """
+        if not tickers:
+            return {}
+
+        rows = self.db.query(MarketPrice.security_ticker, MarketPrice.price).filter(
+            MarketPrice.security_ticker.in_(tickers),
+            MarketPrice.valid_from == valid_date,
+            MarketPrice.transaction_to == None
+        ).all()
+
+        return {ticker: price for ticker, price in rows}
+
     def get_latest_price_before(self, ticker: str, as_of_date: date):
         """
         Get the latest known valid price on or before `as_of_date`.
@@ -72,15 +72,6 @@ def seed():
         {"ticker": "PMDZ", "name": "Pamodzi Hotel Plc", "sector": "Consumer Services", "price": 5.00},
     ]
 
-    print("Seeding Securities...")
-    for t in tickers:
-        try:
-            service.create_ticker(t["ticker"], t["name"], t["sector"])
-            print(f"Created {t['ticker']}")
-        except Exception:
-            print(f"Skipping {t['ticker']} (already exists)")
-            db.rollback()
-
     # 1.1 Seed Bonds (Government)
     bonds = [
         {"ticker": "GRZ-2Y", "name": "GRZ 2 Year Bond", "coupon": 0.09, "maturity": date.today() + timedelta(days=365*2)},
@@ -89,22 +80,28 @@ def seed():
         {"ticker": "GRZ-10Y", "name": "GRZ 10 Year Bond", "coupon": 0.15, "maturity": date.today() + timedelta(days=365*10)},
         {"ticker": "GRZ-15Y", "name": "GRZ 15 Year Bond", "coupon": 0.16, "maturity": date.today() + timedelta(days=365*15)},
     ]
-    
-    print("Seeding Bonds...")
-    for b in bonds:
-        try:
-            service.create_ticker(
-                ticker=b["ticker"], 
-                name=b["name"], 
-                sector="Government Bonds",
-                security_type="Bond",
-                maturity_date=b["maturity"],
-                coupon_rate=b["coupon"]
-            )
-            print(f"Created {b['ticker']}")
-        except Exception as e:
-            print(f"Skipping {b['ticker']} ({str(e)})")
-            db.rollback()
+
+    print("Seeding Securities and Bonds...")
+    securities = [
+        {"ticker": t["ticker"], "name": t["name"], "sector": t["sector"]}
+        for t in tickers
+    ] + [
+        {
+            "ticker": b["ticker"],
+            "name": b["name"],
+            "sector": "Government Bonds",
+            "security_type": "Bond",
+            "maturity_date": b["maturity"],
+            "coupon_rate": b["coupon"]
+        }
+        for b in bonds
+    ]
+    created = {sec.ticker for sec in service.create_tickers_bulk(securities)}
+    for sec in securities:
+        if sec["ticker"] in created:
+            print(f"Created {sec['ticker']}")
+        else:
+            print(f"Skipping {sec['ticker']} (already exists)")
 
     # 2. Seed Price History (Last 1 year)
     print("Seeding Price History...")
@@ -1,23 +1,24 @@
 """
 BoZ Yield Curve Ingestion: Fetches and parses BoZ yield curve data, bootstraps zero-coupon curve, and stores in yield_curve table.
 """
-import requests
 import logging
 from datetime import datetime
 # from QuantLib import ...  # QuantLib integration for bootstrapping
 
 from app.core.database import SessionLocal
+from app.core.http_client import create_retry_session
 from app.models.yield_curve import YieldCurveData
 
 BOZ_URL = "https://www.boz.zm/monetary-policy/statistics/yield-curve/"  # Example URL
 logger = logging.getLogger("boz_yield_curve")
+_SESSION = create_retry_session()
 
 
 def fetch_boz_yield_curve():
     """Fetch and store BoZ yield curve data."""
     session = SessionLocal()
     try:
-        response = requests.get(BOZ_URL)
+        response = _SESSION.get(BOZ_URL, timeout=30)
         response.raise_for_status()
         # TODO: Parse HTML or CSV for yield curve points (tenor, yield)
         # Example parsed data:
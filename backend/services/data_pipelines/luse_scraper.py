@@ -1,21 +1,27 @@
 """
 LuSE Data Scraper: Fetches daily equity prices from afx.kwayisi.org and stores them in the price_history table.
 """
-import requests
+import pandas as pd
 from bs4 import BeautifulSoup
 import logging
 from datetime import datetime
+from operator import itemgetter
 
 
 # ORM/database session imports
 from app.core.database import SessionLocal
+from app.core.http_client import create_retry_session
 from app.models.asset import Asset
 from app.models.price_history import PriceHistory
 
 LUSE_URL = "https://afx.kwayisi.org/zse/"
 SECURITIES = ["ZCCM-IH", "Zanaco", "ZESCO", "Barclays"]  # Extend as needed
 
+# Security, close price and volume cells of a price-table row
+_ROW_FIELDS = itemgetter(0, 1, 4)
+
 logger = logging.getLogger("luse_scraper")
+_SESSION = create_retry_session()
 
 
 
@@ -24,24 +30,41 @@ def fetch_luse_prices():
     results = []
     session = SessionLocal()
     try:
-        response = requests.get(LUSE_URL)
+        response = _SESSION.get(LUSE_URL, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml")
         table = soup.find("table")
         if not table:
             logger.error("No table found on LUSE page.")
             return results
+        rows = []
         for row in table.find_all("tr")[1:]:
             cols = row.find_all("td")
             if len(cols) < 5:
                 continue
-            security = cols[0].text.strip()
+            security, price_text, volume_text = (cell.text for cell in _ROW_FIELDS(cols))
+            security = security.strip()
             if security not in SECURITIES:
                 continue
+            rows.append((security, price_text, volume_text))
+        if not rows:
+            return results
+        # Vectorised numeric parsing; malformed cells become NaN instead of raising
+        frame = pd.DataFrame(rows, columns=["security", "price", "volume"])
+        for column in ("price", "volume"):
+            frame[column] = pd.to_numeric(
+                frame[column].str.replace(",", "", regex=False), errors="coerce"
+            )
+        # One timestamp per batch keeps valid_from == transaction_from across rows
+        now = datetime.now()
+        trade_date = now.date()
+        for security, price, volume in frame.itertuples(index=False):
+            if pd.isna(price) or pd.isna(volume):
+                logger.warning(f"Could not parse price/volume for {security}")
+                continue
             try:
-                price = float(cols[1].text.replace(",", ""))
-                volume = int(cols[4].text.replace(",", ""))
-                trade_date = datetime.now().date()
+                price = float(price)
+                volume = int(volume)
                 # Data validation
                 if price < 0 or volume < 0:
                     logger.warning(f"Invalid data for {security}: price={price}, volume={volume}")
@@ -57,9 +80,9 @@ def fetch_luse_prices():
                     trade_date=trade_date,
                     close_price=price,
                     volume=volume,
-                    valid_from=datetime.now(),
+                    valid_from=now,
                     valid_to=None,
-                    transaction_from=datetime.now(),
+                    transaction_from=now,
                     transaction_to=None,
                     is_current=True
                 )
@@ -72,7 +95,7 @@ def fetch_luse_prices():
                     "trade_date": trade_date
                 })
             except Exception as e:
-                logger.error(f"Error parsing row for {security}: {e}")
+                logger.error(f"Error storing row for {security}: {e}")
                 session.rollback()
     except Exception as e:
         logger.error(f"Failed to fetch LUSE data: {e}")
@@ -1,22 +1,23 @@
 """
 ZamStats CPI Data Ingestion: Fetches monthly CPI data and stores it for inflation calculations.
 """
-import requests
 import logging
 from datetime import datetime
 
 from app.core.database import SessionLocal
+from app.core.http_client import create_retry_session
 from app.models.market_data import MarketData
 
 ZAMSTATS_URL = "https://www.zamstats.gov.zm/index.php/publications/category/13-consumer-price-index-cpi"  # Example URL
 logger = logging.getLogger("zamstats_cpi")
+_SESSION = create_retry_session()
 
 
 def fetch_zamstats_cpi():
     """Fetch and store ZamStats CPI data."""
     session = SessionLocal()
     try:
-        response = requests.get(ZAMSTATS_URL)
+        response = _SESSION.get(ZAMSTATS_URL, timeout=30)
         response.raise_for_status()
         # TODO: Parse HTML or CSV for CPI values and dates
         # Example parsed data:
@@ -8,6 +8,7 @@ Tests cover:
 - Edge cases (insufficient data, zero variance)
 """
 
+import random
 import pytest
 import numpy as np
 import pandas as pd
@@ -28,7 +29,7 @@ from app.services.analytics import (
 
 # ==================== Fixtures ====================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_price_data():
     """Generate sample price history mimicking PriceHistory model."""
     
@@ -65,6 +66,16 @@ def sample_price_data():
     return asset_records, benchmark_records
 
 
+@pytest.fixture(scope="module")
+def sample_dataframes(sample_price_data):
+    """Asset and benchmark DataFrames converted once per module."""
+    asset_records, benchmark_records = sample_price_data
+    return (
+        convert_prices_to_dataframe(asset_records),
+        convert_prices_to_dataframe(benchmark_records)
+    )
+
+
 @pytest.fixture
 def sparse_price_data():
     """Generate sparse price data (simulating LuSE illiquidity)."""
@@ -86,6 +97,36 @@ def sparse_price_data():
     return [MockPriceHistory(d, p) for d, p in zip(dates, prices)]
 
 
+@pytest.fixture(scope="module")
+def rng_bench_52():
+    """52 weekly benchmark returns ~ N(0, 0.02), drawn once per module."""
+    returns = np.random.default_rng(42).normal(0, 0.02, 52)
+    returns.setflags(write=False)
+    return returns
+
+
+@pytest.fixture(scope="module")
+def rng_noise_52():
+    """52 standard normal draws for idiosyncratic noise, drawn once per module."""
+    noise = np.random.default_rng(7).standard_normal(52)
+    noise.setflags(write=False)
+    return noise
+
+
+@pytest.fixture(scope="module")
+def benchmark_returns(rng_bench_52):
+    """Benchmark return Series shared by the parametrized beta tests."""
+    return pd.Series(rng_bench_52)
+
+
+@pytest.fixture(scope="module")
+def rng_returns_1000():
+    """1000 returns ~ N(0, 0.02) for VaR tests, drawn once per module."""
+    returns = np.random.default_rng(42).normal(0, 0.02, 1000)
+    returns.setflags(write=False)
+    return returns
+
+
 # ==================== Unit Tests: Helper Functions ====================
 
 class TestConvertPricesToDataframe:
@@ -114,8 +155,9 @@ class TestConvertPricesToDataframe:
         """Test that DataFrame index is sorted."""
         asset_records, _ = sample_price_data
         
-        # Shuffle records
-        np.random.shuffle(asset_records)
+        # Shuffle a copy so the shared fixture list keeps its order
+        asset_records = list(asset_records)
+        random.Random(42).shuffle(asset_records)
         
         df = convert_prices_to_dataframe(asset_records)
         
@@ -125,12 +167,9 @@ class TestConvertPricesToDataframe:
 class TestPrepareReturnsData:
     """Tests for prepare_returns_data function."""
     
-    def test_weekly_resampling(self, sample_price_data):
+    def test_weekly_resampling(self, sample_dataframes):
         """Test that data is properly resampled to weekly frequency."""
-        asset_records, benchmark_records = sample_price_data
-        
-        asset_df = convert_prices_to_dataframe(asset_records)
-        benchmark_df = convert_prices_to_dataframe(benchmark_records)
+        asset_df, benchmark_df = sample_dataframes
         
         asset_returns, benchmark_returns = prepare_returns_data(
             asset_df, benchmark_df, resample_freq="W"
@@ -141,12 +180,9 @@ class TestPrepareReturnsData:
         # Weekly data from ~100 days should give ~14 weeks
         assert 10 <= len(asset_returns) <= 20
     
-    def test_returns_alignment(self, sample_price_data):
+    def test_returns_alignment(self, sample_dataframes):
         """Test that returns are properly aligned."""
-        asset_records, benchmark_records = sample_price_data
-        
-        asset_df = convert_prices_to_dataframe(asset_records)
-        benchmark_df = convert_prices_to_dataframe(benchmark_records)
+        asset_df, benchmark_df = sample_dataframes
         
         asset_returns, benchmark_returns = prepare_returns_data(
             asset_df, benchmark_df
@@ -156,12 +192,9 @@ class TestPrepareReturnsData:
         assert len(asset_returns) == len(benchmark_returns)
         assert all(asset_returns.index == benchmark_returns.index)
     
-    def test_log_returns(self, sample_price_data):
+    def test_log_returns(self, sample_dataframes):
         """Test that log returns are calculated correctly."""
-        asset_records, benchmark_records = sample_price_data
-        
-        asset_df = convert_prices_to_dataframe(asset_records)
-        benchmark_df = convert_prices_to_dataframe(benchmark_records)
+        asset_df, benchmark_df = sample_dataframes
         
         asset_returns, _ = prepare_returns_data(asset_df, benchmark_df)
         
@@ -173,16 +206,23 @@ class TestPrepareReturnsData:
 class TestCalculateBeta:
     """Tests for calculate_beta function."""
     
-    def test_beta_calculation(self):
-        """Test basic beta calculation."""
-        # Perfect positive correlation should give beta ~1
-        np.random.seed(42)
-        benchmark = pd.Series(np.random.normal(0, 0.02, 52))
-        asset = 1.2 * benchmark + np.random.normal(0, 0.005, 52)  # Beta ~1.2
+    @pytest.mark.parametrize(
+        "scale,noise,in_range",
+        [
+            (1.2, 0.005, lambda b: 1.0 <= b <= 1.4),     # Aggressive stock
+            (1.0, 0.001, lambda b: 0.95 <= b <= 1.05),   # Almost identical to benchmark
+            (0.5, 0.005, lambda b: 0 < b < 1),           # Defensive stock
+            (-0.5, 0.005, lambda b: b < 0),              # Negatively correlated
+        ],
+        ids=["aggressive", "highly_correlated", "defensive", "negative"]
+    )
+    def test_beta_calculation(self, benchmark_returns, rng_noise_52, scale, noise, in_range):
+        """Test beta calculation against a table of known exposures."""
+        asset = scale * benchmark_returns + noise * rng_noise_52
         
-        beta = calculate_beta(asset, benchmark)
+        beta = calculate_beta(asset, benchmark_returns)
         
-        assert 1.0 <= beta <= 1.4  # Should be close to 1.2
+        assert in_range(beta)
     
     def test_beta_zero_variance_error(self):
         """Test that zero variance raises error."""
@@ -204,15 +244,34 @@ class TestCalculateBeta:
         
         assert exc_info.value.error_code == "INSUFFICIENT_DATA"
 
+    def test_beta_aligns_on_index_and_drops_nan(self, benchmark_returns, rng_noise_52):
+        """Test that unequal lengths and NaN are paired by index like Series.cov."""
+        asset = (1.2 * benchmark_returns + 0.005 * rng_noise_52).iloc[:40]
+        asset.iloc[5] = np.nan
+
+        beta = calculate_beta(asset, benchmark_returns)
+
+        paired = pd.concat([asset, benchmark_returns], axis=1).dropna()
+        assert beta == pytest.approx(paired[0].cov(paired[1]) / paired[1].var())
+
+    def test_beta_no_overlap_insufficient_data(self):
+        """Test that series with fewer than two overlapping points raise error."""
+        asset = pd.Series([0.01, np.nan, 0.03])
+        benchmark = pd.Series([np.nan, 0.02, np.nan])
+
+        with pytest.raises(RiskCalculationError) as exc_info:
+            calculate_beta(asset, benchmark)
+
+        assert exc_info.value.error_code == "INSUFFICIENT_DATA"
+
 
 class TestCalculateVar95:
     """Tests for calculate_var_95 function."""
     
-    def test_var_calculation(self):
+    def test_var_calculation(self, rng_returns_1000):
         """Test VaR calculation with known distribution."""
         # Normal distribution with mean 0, std 0.02
-        np.random.seed(42)
-        returns = pd.Series(np.random.normal(0, 0.02, 1000))
+        returns = pd.Series(rng_returns_1000)
         
         var = calculate_var_95(returns)
         
@@ -229,10 +288,9 @@ class TestCalculateVar95:
         
         assert exc_info.value.error_code == "INSUFFICIENT_DATA"
     
-    def test_var_returns_percentage(self):
+    def test_var_returns_percentage(self, rng_returns_1000):
         """Test that VaR is returned as percentage."""
-        np.random.seed(42)
-        returns = pd.Series(np.random.normal(0, 0.02, 100))
+        returns = pd.Series(rng_returns_1000[:100])
         
         var = calculate_var_95(returns)
         
@@ -335,10 +393,8 @@ class TestRiskEngineAsync:
         
         # Mock the execute and scalars chain
         mock_result = Mock()
-        mock_result.scalars.return_value.all.side_effect = [
-            asset_records,
-            benchmark_records
-        ]
+        results = iter([asset_records, benchmark_records])
+        mock_result.scalars.return_value.all = lambda: next(results)
         mock_db.execute.return_value = mock_result
         
         engine = RiskEngine(mock_db)
@@ -393,42 +449,3 @@ class TestRiskMetricsSchema:
         assert "beta" in json_data
         assert "var_95" in json_data
         assert "observation_count" in json_data
-
-
-# ==================== Edge Case Tests ====================
-
-class TestEdgeCases:
-    """Tests for edge cases and boundary conditions."""
-    
-    def test_highly_correlated_assets(self):
-        """Test beta calculation with highly correlated assets."""
-        np.random.seed(42)
-        benchmark = pd.Series(np.random.normal(0, 0.02, 52))
-        asset = benchmark + np.random.normal(0, 0.001, 52)  # Almost identical
-        
-        beta = calculate_beta(asset, benchmark)
-        
-        # Beta should be very close to 1
-        assert 0.95 <= beta <= 1.05
-    
-    def test_negative_beta(self):
-        """Test beta calculation with negatively correlated assets."""
-        np.random.seed(42)
-        benchmark = pd.Series(np.random.normal(0, 0.02, 52))
-        asset = -0.5 * benchmark + np.random.normal(0, 0.005, 52)
-        
-        beta = calculate_beta(asset, benchmark)
-        
-        # Beta should be negative
-        assert beta < 0
-    
-    def test_defensive_stock(self):
-        """Test beta calculation for defensive stock (beta < 1)."""
-        np.random.seed(42)
-        benchmark = pd.Series(np.random.normal(0, 0.02, 52))
-        asset = 0.5 * benchmark + np.random.normal(0, 0.005, 52)
-        
-        beta = calculate_beta(asset, benchmark)
-        
-        # Beta should be less than 1
-        assert 0 < beta < 1
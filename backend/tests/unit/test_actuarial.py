@@ -38,3 +38,18 @@ def test_portfolio_optimizer():
     
     assert sum(metrics.weights.values()) == pytest.approx(1.0)
     assert metrics.sharpe_ratio > 0
+
+@pytest.mark.parametrize("i", [0.0, 1e-10, 1e-9, 1e-8, 1e-6, 0.025, 0.10])
+def test_increasing_annuity_matches_explicit_sum(i):
+    n = 20
+    expected = sum(t * (1 + i) ** -t for t in range(1, n + 1))
+    assert AnnuityCalculator.increasing_annuity_immediate(i, n) == pytest.approx(expected, rel=1e-12)
+
+@pytest.mark.parametrize("y", [1e-10, 1e-9, 1e-8])
+def test_macaulay_duration_near_zero_yield(y):
+    # 10-year 5% semi-annual bond: explicit Σ t·PV(CF_t) / Price
+    n, c = 20, 2.5
+    v = 1 / (1 + y / 2)
+    weighted = sum((t / 2) * c * v ** t for t in range(1, n + 1)) + 10 * 100 * v ** n
+    price = sum(c * v ** t for t in range(1, n + 1)) + 100 * v ** n
+    assert BondPricer.macaulay_duration(100, 0.05, y, 10) == pytest.approx(weighted / price, rel=1e-6)
@@ -1,6 +1,6 @@
 import pytest
 from app.services.auth_service import get_password_hash, verify_password, create_access_token
-from jose import jwt, JWTError
+import jwt
 from app.services.auth_service import SECRET_KEY, ALGORITHM
 
 def test_password_hashing():
@@ -0,0 +1,84 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.models import MarketPrice, Security
+from app.services.market_data import MarketDataService
+
+VALID_DATE = datetime(2026, 1, 5)
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Security.__table__.create(bind=engine)
+    MarketPrice.__table__.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+def test_ingest_prices_bulk_closes_open_rows_and_inserts_batch(db):
+    old_tx = datetime(2026, 1, 5, 9, 0)
+    db.add_all([
+        MarketPrice(security_ticker="ZNCO", price=1.0, volume=10, valid_from=VALID_DATE, transaction_from=old_tx),
+        MarketPrice(security_ticker="ZNCO", price=0.9, volume=10, valid_from=datetime(2026, 1, 2), transaction_from=old_tx),
+        MarketPrice(security_ticker="CECZ", price=5.0, volume=10, valid_from=VALID_DATE, transaction_from=old_tx),
+    ])
+    db.commit()
+
+    MarketDataService(db).ingest_prices_bulk([("ZNCO", 1.1, 100), ("REIZ", 2.0, 200)], VALID_DATE)
+
+    rows = db.query(MarketPrice).order_by(MarketPrice.id).all()
+    closed_znco, other_day, untouched, new_znco, new_reiz = rows
+
+    # Only the open row for a batch ticker on the batch date is superseded
+    assert closed_znco.transaction_to is not None
+    assert other_day.transaction_to is None
+    assert untouched.transaction_to is None
+
+    assert [(r.security_ticker, r.price, r.volume) for r in (new_znco, new_reiz)] == [("ZNCO", 1.1, 100), ("REIZ", 2.0, 200)]
+    assert new_znco.transaction_to is None and new_reiz.transaction_to is None
+    # One shared transaction time, which is also when the old row was closed
+    assert new_znco.transaction_from == new_reiz.transaction_from == closed_znco.transaction_to
+
+def test_ingest_prices_bulk_empty_batch_is_noop(db):
+    MarketDataService(db).ingest_prices_bulk([], VALID_DATE)
+    assert db.query(MarketPrice).count() == 0
+
+def test_get_prices_as_of_bulk_returns_current_prices_only(db):
+    tx = datetime(2026, 1, 5, 9, 0)
+    db.add_all([
+        MarketPrice(security_ticker="ZNCO", price=1.0, volume=10, valid_from=VALID_DATE, transaction_from=tx, transaction_to=tx),
+        MarketPrice(security_ticker="ZNCO", price=1.1, volume=10, valid_from=VALID_DATE, transaction_from=tx),
+        MarketPrice(security_ticker="REIZ", price=2.0, volume=10, valid_from=VALID_DATE, transaction_from=tx),
+        MarketPrice(security_ticker="CECZ", price=5.0, volume=10, valid_from=datetime(2026, 1, 2), transaction_from=tx),
+    ])
+    db.commit()
+
+    prices = MarketDataService(db).get_prices_as_of_bulk(["ZNCO", "REIZ", "CECZ", "XXXX"], VALID_DATE)
+
+    # Superseded rows are ignored; tickers with no price on the date are left out
+    assert prices == {"ZNCO": 1.1, "REIZ": 2.0}
+
+def test_get_prices_as_of_bulk_empty_tickers(db):
+    assert MarketDataService(db).get_prices_as_of_bulk([], VALID_DATE) == {}
+
+def test_create_tickers_bulk_skips_existing_and_maps_type(db):
+    db.add(Security(ticker="ZNCO", name="Zanaco Plc", sector="Banking"))
+    db.commit()
+
+    created = MarketDataService(db).create_tickers_bulk([
+        {"ticker": "ZNCO", "name": "Zanaco Plc", "sector": "Banking"},
+        {"ticker": "CECZ", "name": "Copperbelt Energy Corporation Plc", "sector": "Energy"},
+        {"ticker": "GRZ-2Y", "name": "GRZ 2 Year Bond", "sector": "Government Bonds",
+         "security_type": "Bond", "maturity_date": datetime(2028, 1, 5), "coupon_rate": 0.09},
+    ])
+
+    assert [sec.ticker for sec in created] == ["CECZ", "GRZ-2Y"]
+    assert db.query(Security).count() == 3
+    bond = db.query(Security).filter_by(ticker="GRZ-2Y").one()
+    assert (bond.type, bond.coupon_rate) == ("Bond", 0.09)
+    assert db.query(Security).filter_by(ticker="CECZ").one().type == "Equity"
+
+def test_create_tickers_bulk_empty_is_noop(db):
+    assert MarketDataService(db).create_tickers_bulk([]) == []
@@ -2,7 +2,9 @@
 import sys
 import os
 from datetime import date, datetime
-import random
+from types import MappingProxyType
+
+import numpy as np
 
 # Ensure we can import app modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
@@ -18,124 +20,124 @@ try:
 except ImportError:
     USD_TO_ZMW = 22.50  # Fallback rate
 
+# USD-denominated securities (will be converted to ZMW)
+USD_PRICES = MappingProxyType({
+    "REIZ": 0.09,       # Real Estate Investments Zambia (USD on LuSE)
+})
+
+# Real LuSE prices as of 31 December 2025 (in ZMW - Zambian Kwacha)
+# Source: LuSE Official Market Data (www.luse.co.zm/trading/market-data/)
+ZMW_PRICES = MappingProxyType({
+    # Banking & Financials
+    "ZNCO": 5.98,       # Zanaco - Zambia National Commercial Bank
+    "SCBL": 2.55,       # Standard Chartered Bank Zambia
+    "MAFS": 1.81,       # Madison Financial Services
+    "ZMRE": 2.70,       # Zambia Reinsurance
+
+    # Mining & Basic Materials
+    "ZCCM": 166.00,     # ZCCM-IH - flagship mining investment holding
+    "AECI": 130.00,     # AECI Mining Explosives
+    "ZFCO": 3.57,       # ZAFFICO (Forestry)
+
+    # Telecommunications
+    "ATEL": 137.73,     # Airtel Networks Zambia - strong performer
+
+    # Consumer Goods
+    "BATZ": 14.25,      # British American Tobacco Zambia
+    "BATA": 6.53,       # Bata Zambia
+    "ZMBF": 2.20,       # Zambeef Products
+    "ZSUG": 66.97,      # Zambia Sugar
+    "ZABR": 7.01,       # Zambian Breweries
+    "NATB": 2.99,       # National Breweries
+
+    # Industrial & Utilities
+    "CECZ": 19.30,      # Copperbelt Energy Corporation
+    "CHIL": 80.00,      # Chilanga Cement (Lafarge)
+    "ZMFA": 60.00,      # Metal Fabricators of Zambia (ZAMEFA)
+
+    # Energy
+    "PUMA": 4.00,       # Puma Energy Zambia
+
+    # Retail
+    "SHOP": 350.00,     # Shoprite Holdings - premium retail stock
+
+    # Agriculture
+    "FARM": 5.80,       # Zambia Seed Company (if applicable)
+
+    # Technology
+    "DCZM": 21.87,      # Dot Com Zambia
+})
+
+# Convert USD prices to ZMW and merge (read-only, built once at import)
+REAL_PRICES = MappingProxyType({
+    **ZMW_PRICES,
+    **{ticker: round(usd_price * USD_TO_ZMW, 2) for ticker, usd_price in USD_PRICES.items()},
+})
+
+# Delisted or suspended securities
+DELISTED = frozenset({"INVEST", "INVE"})
+
+
 def seed_real_prices():
     db = SessionLocal()
     today = date.today()
     valid_from = datetime.combine(today, datetime.min.time())
     
-    # USD-denominated securities (will be converted to ZMW)
-    usd_prices = {
-        "REIZ": 0.09,       # Real Estate Investments Zambia (USD on LuSE)
-    }
-    
-    # Real LuSE prices as of 31 December 2025 (in ZMW - Zambian Kwacha)
-    # Source: LuSE Official Market Data (www.luse.co.zm/trading/market-data/)
-    zmw_prices = {
-        # Banking & Financials
-        "ZNCO": 5.98,       # Zanaco - Zambia National Commercial Bank
-        "SCBL": 2.55,       # Standard Chartered Bank Zambia
-        "MAFS": 1.81,       # Madison Financial Services
-        "ZMRE": 2.70,       # Zambia Reinsurance
-        
-        # Mining & Basic Materials
-        "ZCCM": 166.00,     # ZCCM-IH - flagship mining investment holding
-        "AECI": 130.00,     # AECI Mining Explosives
-        "ZFCO": 3.57,       # ZAFFICO (Forestry)
-        
-        # Telecommunications
-        "ATEL": 137.73,     # Airtel Networks Zambia - strong performer
-        
-        # Consumer Goods
-        "BATZ": 14.25,      # British American Tobacco Zambia
-        "BATA": 6.53,       # Bata Zambia
-        "ZMBF": 2.20,       # Zambeef Products
-        "ZSUG": 66.97,      # Zambia Sugar
-        "ZABR": 7.01,       # Zambian Breweries
-        "NATB": 2.99,       # National Breweries
-        
-        # Industrial & Utilities
-        "CECZ": 19.30,      # Copperbelt Energy Corporation
-        "CHIL": 80.00,      # Chilanga Cement (Lafarge)
-        "ZMFA": 60.00,      # Metal Fabricators of Zambia (ZAMEFA)
-        
-        # Energy
-        "PUMA": 4.00,       # Puma Energy Zambia
-        
-        # Retail
-        "SHOP": 350.00,     # Shoprite Holdings - premium retail stock
-        
-        # Agriculture
-        "FARM": 5.80,       # Zambia Seed Company (if applicable)
-        
-        # Technology
-        "DCZM": 21.87,      # Dot Com Zambia
-    }
-    
-    # Convert USD prices to ZMW and merge
-    real_prices = zmw_prices.copy()
-    for ticker, usd_price in usd_prices.items():
-        real_prices[ticker] = round(usd_price * USD_TO_ZMW, 2)
-
-    # Delisted or suspended securities
-    delisted = ["INVEST", "INVE"]
-
     print(f"Updating prices for {today}...")
     print(f"USD/ZMW Exchange Rate: {USD_TO_ZMW}")
-    print(f"REIZ (USD 0.09) -> K{real_prices['REIZ']:.2f}")
+    print(f"REIZ (USD 0.09) -> K{REAL_PRICES['REIZ']:.2f}")
 
     # Get all securities
     securities = db.query(Security).all()
+    now = datetime.now()
+    rows = []
     
     for sec in securities:
         ticker = sec.ticker.upper()
         
         # Handle Delisted
-        if ticker in delisted or any(d in sec.name.upper() for d in ["INVESTRUST"]):
+        if ticker in DELISTED or any(d in sec.name.upper() for d in ["INVESTRUST"]):
             print(f"Skipping Delisted: {ticker}")
             # Optional: Set suspended flag if model supports it (Security model in core doesn't seem to have is_suspended, but check)
             continue
 
         # Determine base price
-        if ticker in real_prices:
-            base_price = real_prices[ticker]
-        elif ticker == "LAFA" and "CHIL" in real_prices:
+        if ticker in REAL_PRICES:
+            base_price = REAL_PRICES[ticker]
+        elif ticker == "LAFA" and "CHIL" in REAL_PRICES:
              # If we have LAFA but it is actually CHIL
-             base_price = real_prices["CHIL"] 
+             base_price = REAL_PRICES["CHIL"] 
         else:
             # Fallback for unknown
             base_price = 5.0 
         
-        # We use exact price for "Close", maybe slight noise for Open/High/Low to simulate daily range
+        # We use exact price for "Close"
         final_price = base_price 
-        
-        # 1. Close previous active record
-        existing = db.query(MarketPrice).filter(
-            MarketPrice.security_ticker == sec.ticker,
-            MarketPrice.valid_from == valid_from,
-            MarketPrice.transaction_to == None
-        ).first()
-
-        if existing:
-            existing.transaction_to = datetime.now()
-            db.add(existing)
-
-        # 2. Insert new record
-        # Simulate daily candle
-        open_p = final_price * (1 + (random.random() - 0.5) * 0.01)
-        high_p = max(open_p, final_price) * 1.005
-        low_p = min(open_p, final_price) * 0.995
-
-        new_price = MarketPrice(
-            security_ticker=sec.ticker,
-            price=final_price,
-            volume=int(random.random() * 50000), # Random volume
-            valid_from=valid_from,
-            transaction_from=datetime.now(),
-            transaction_to=None 
-        )
-        db.add(new_price)
+
+        rows.append({
+            "security_ticker": sec.ticker,
+            "price": final_price,
+            "valid_from": valid_from,
+            "transaction_from": now,
+            "transaction_to": None
+        })
         print(f"Updated {ticker}: K{final_price:.2f}")
 
+    # Random volumes for the whole batch from one generator call
+    volumes = (np.random.default_rng().random(len(rows)) * 50000).astype(np.int64)
+    for row, volume in zip(rows, volumes.tolist()):
+        row["volume"] = volume
+
+    # 1. Close previous active records for today in a single UPDATE
+    db.query(MarketPrice).filter(
+        MarketPrice.security_ticker.in_([row["security_ticker"] for row in rows]),
+        MarketPrice.valid_from == valid_from,
+        MarketPrice.transaction_to == None
+    ).update({"transaction_to": now}, synchronize_session=False)
+
+    # 2. Insert new records in one batch, bypassing per-object unit-of-work
+    db.bulk_insert_mappings(MarketPrice, rows)
+
     db.commit()
     print("Market Data Update Complete (Real World Values).")
 
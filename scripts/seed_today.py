@@ -3,7 +3,8 @@ from app.core.db import SessionLocal
 from app.services.market_data import MarketDataService
 from app.core.models import Security, MarketPrice
 from datetime import date, timedelta
-import random
+from sqlalchemy import text
+import numpy as np
 
 def seed_today():
     db = SessionLocal()
@@ -12,26 +13,45 @@ def seed_today():
     today = date.today()
     print(f"Seeding for {today}...")
 
-    # Get all securities
-    securities = db.query(Security).all()
+    # Seeding is re-runnable, so on SQLite trade durability for load speed and restore afterwards
+    is_sqlite = db.bind.dialect.name == "sqlite"
+    if is_sqlite:
+        saved_pragmas = {
+            name: db.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("synchronous", "journal_mode")
+        }
+
+    try:
+        if is_sqlite:
+            for pragma in ("synchronous=OFF", "journal_mode=MEMORY", "temp_store=MEMORY", "cache_size=-200000"):
+                db.execute(text(f"PRAGMA {pragma}"))
+
+        # Get all securities
+        securities = db.query(Security).all()
+        tickers = [sec.ticker for sec in securities]
+
+        # Yesterday's prices for every security in one query
+        latest = service.get_prices_as_of_bulk(tickers, today - timedelta(days=1))
+        start_prices = np.array([latest.get(ticker, 10.0) for ticker in tickers])
+    
+        # Random walk and volumes for the whole universe at once
+        rng = np.random.default_rng()
+        changes = rng.uniform(-0.02, 0.02, len(tickers))
+        new_prices = np.maximum(0.01, start_prices * (1 + changes)).round(2)
+        vols = rng.integers(100, 5000, len(tickers), endpoint=True)
+    
+        for ticker, start_price, new_price in zip(tickers, start_prices, new_prices):
+            print(f"Updating {ticker}: {start_price} -> {new_price:.2f}")
     
-    for sec in securities:
-        # Get latest price to walk from
-        latest = service.get_price_as_of(sec.ticker, today - timedelta(days=1))
-        
-        start_price = latest.price if latest else 10.0
-        
-        # Random walk
-        change = random.uniform(-0.02, 0.02)
-        new_price = max(0.01, start_price * (1 + change))
-        
-        # Volume
-        vol = random.randint(100, 5000)
-        
-        print(f"Updating {sec.ticker}: {start_price} -> {new_price:.2f}")
-        service.ingest_price(sec.ticker, round(new_price, 2), vol, today)
-        
-    db.close()
+        # One transaction for the whole batch instead of a commit per security
+        service.ingest_prices_bulk(list(zip(tickers, new_prices.tolist(), vols.tolist())), today)
+    finally:
+        if is_sqlite:
+            # End any failed transaction first: journal_mode cannot change inside one
+            db.rollback()
+            for name, value in saved_pragmas.items():
+                db.execute(text(f"PRAGMA {name}={value}"))
+        db.close()
     print("Seeding Complete.")
 
 if __name__ == "__main__":
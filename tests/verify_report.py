@@ -1,56 +1,65 @@
-
-import requests
-import sys
+import httpx
+import pytest
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One keep-alive client for login and the report download
+SESSION = httpx.Client(
+    timeout=httpx.Timeout(10.0, connect=2.0),
+    transport=httpx.HTTPTransport(retries=2, limits=httpx.Limits(max_keepalive_connections=4))
+)
+
 def test_report_generation():
     # 1. Login
     try:
-        resp = requests.post(f"{BASE_URL}/auth/login", json={
+        resp = SESSION.post(f"{BASE_URL}/auth/login", json={
             "username": "totp_api_user", # Use existing user from previous test or register new
             "password": "password123"
         })
         
         if resp.status_code != 200:
             # Try registering
-            requests.post(f"{BASE_URL}/auth/register", json={
+            SESSION.post(f"{BASE_URL}/auth/register", json={
                 "username": "report_user",
                 "email": "report@test.com",
                 "password": "password123"
             })
-            resp = requests.post(f"{BASE_URL}/auth/login", json={
+            resp = SESSION.post(f"{BASE_URL}/auth/login", json={
                 "username": "report_user",
                 "password": "password123"
             })
             
         if resp.status_code != 200:
-            print("Login failed")
-            sys.exit(1)
+            pytest.fail("Login failed")
             
         token = resp.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
+        SESSION.headers.update({"Authorization": f"Bearer {token}"})
         
         # 2. Get Report
         print("Requesting PDF Report...")
-        resp = requests.get(f"{BASE_URL}/reports/market-summary", headers=headers)
-        
-        if resp.status_code == 200:
-            content_type = resp.headers.get("content-type")
-            if "application/pdf" in content_type:
-                print(f"SUCCESS: Received PDF ({len(resp.content)} bytes).")
-                with open("market_summary.pdf", "wb") as f:
-                    f.write(resp.content)
+        # Stream the PDF straight to disk instead of buffering it in memory
+        with SESSION.stream(
+            "GET", f"{BASE_URL}/reports/market-summary",
+            headers={"Accept-Encoding": "gzip"},
+            timeout=httpx.Timeout(30.0, connect=2.0)
+        ) as resp:
+            if resp.status_code == 200:
+                content_type = resp.headers.get("content-type")
+                if "application/pdf" in content_type:
+                    total = 0
+                    with open("market_summary.pdf", "wb") as f:
+                        for chunk in resp.iter_bytes(64 * 1024):
+                            f.write(chunk)
+                            total += len(chunk)
+                    print(f"SUCCESS: Received PDF ({total} bytes).")
+                else:
+                     pytest.fail(f"FAILED: Content-Type is {content_type}")
             else:
-                 print(f"FAILED: Content-Type is {content_type}")
-                 sys.exit(1)
-        else:
-            print(f"FAILED: {resp.status_code} {resp.text}")
-            sys.exit(1)
+                resp.read()
+                pytest.fail(f"FAILED: {resp.status_code} {resp.text}")
             
     except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        pytest.fail(f"Error: {e}")
 
 if __name__ == "__main__":
     test_report_generation()
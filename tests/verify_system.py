@@ -1,69 +1,69 @@
-
-import requests
-import sys
+import asyncio
+import httpx
+import pytest
 import json
 from datetime import date
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 BASE_URL = "http://localhost:8000/api/v1"
 USERNAME = "test_sys_user"
 PASSWORD = "password123"
 
+ERRORS = []
+
 def log(msg, status="INFO"):
+    if status == "ERROR":
+        ERRORS.append(msg)
     print(f"[{status}] {msg}")
 
-def verify_system():
-    session = requests.Session()
-    token = None
-    
-    # 1. Health Check
-    try:
-        resp = session.get(f"http://localhost:8000/health")
-        if resp.status_code == 200:
-            log("Health Check Passed", "SUCCESS")
-        else:
-            log(f"Health Check Failed: {resp.status_code}", "ERROR")
-    except Exception as e:
-        log(f"Health Check Connection Failed: {e}", "ERROR")
-        sys.exit(1)
+def jloads(resp):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(resp.content)
+    return json.loads(resp.content)
 
+async def login(client):
     # 2. Authentication (Register/Login)
     log("Testing Authentication...")
     try:
         # Try Login
-        resp = session.post(f"{BASE_URL}/auth/login", json={"username": USERNAME, "password": PASSWORD})
-        
+        resp = await client.post(f"{BASE_URL}/auth/login", json={"username": USERNAME, "password": PASSWORD})
+
         if resp.status_code == 401: # Maybe user doesn't exist
             log("User not found, registering...", "INFO")
-            reg = session.post(f"{BASE_URL}/auth/register", json={
+            reg = await client.post(f"{BASE_URL}/auth/register", json={
                 "username": USERNAME, "email": "sys_test@luse.co.zm", "password": PASSWORD
             })
             if reg.status_code in [200, 201]:
                 log("Registration Successful", "SUCCESS")
                 # Login again
-                resp = session.post(f"{BASE_URL}/auth/login", json={"username": USERNAME, "password": PASSWORD})
+                resp = await client.post(f"{BASE_URL}/auth/login", json={"username": USERNAME, "password": PASSWORD})
             else:
-                log(f"Registration Failed: {reg.text}", "ERROR")
-                sys.exit(1)
+                pytest.fail(f"Registration Failed: {reg.text}")
 
         if resp.status_code == 200:
-            token = resp.json()["access_token"]
-            session.headers.update({"Authorization": f"Bearer {token}"})
+            token = jloads(resp)["access_token"]
+            client.headers.update({"Authorization": f"Bearer {token}"})
             log("Login Successful", "SUCCESS")
         else:
-            log(f"Login Failed: {resp.text}", "ERROR")
-            sys.exit(1)
+            pytest.fail(f"Login Failed: {resp.text}")
 
     except Exception as e:
-        log(f"Auth Exception: {e}", "ERROR")
-        sys.exit(1)
+        pytest.fail(f"Auth Exception: {e}")
 
+async def check_market_summary(client):
     # 3. Market Data (Tiles)
     log("Testing Market Data (Tiles)...")
     try:
         today = date.today().isoformat()
-        resp = session.get(f"{BASE_URL}/market-data/market-summary?date={today}")
+        resp = await client.get(f"{BASE_URL}/market-data/market-summary?date={today}")
         if resp.status_code == 200:
-            data = resp.json()
+            data = jloads(resp)
             if len(data) > 0:
                 log(f"Market Summary Received: {len(data)} tickers", "SUCCESS")
             else:
@@ -73,12 +73,13 @@ def verify_system():
     except Exception as e:
         log(f"Market Data Exception: {e}", "ERROR")
 
+async def check_yield_curve(client):
     # 4. Analytics: Yield Curve
     log("Testing Analytics (Yield Curve)...")
     try:
-        resp = session.get(f"{BASE_URL}/analytics/yield-curve")
+        resp = await client.get(f"{BASE_URL}/analytics/yield-curve")
         if resp.status_code == 200:
-            data = resp.json()
+            data = jloads(resp)
             if "curve_points" in data:
                 log("Yield Curve Data Valid", "SUCCESS")
             else:
@@ -88,13 +89,14 @@ def verify_system():
     except Exception as e:
         log(f"Yield Curve Exception: {e}", "ERROR")
 
+async def check_capm(client):
     # 5. Analytics: CAPM
     log("Testing Analytics (CAPM Code)...")
     try:
         ticker = "ZNCO"
-        resp = session.get(f"{BASE_URL}/analytics/capm/{ticker}")
+        resp = await client.get(f"{BASE_URL}/analytics/capm/{ticker}")
         if resp.status_code == 200:
-            data = resp.json()
+            data = jloads(resp)
             if "expected_return" in data:
                 log(f"CAPM for {ticker} Valid: E(R)={data['expected_return']:.2%}", "SUCCESS")
             else:
@@ -104,6 +106,7 @@ def verify_system():
     except Exception as e:
         log(f"CAPM Exception: {e}", "ERROR")
 
+async def check_backtest(client):
     # 6. Backtesting
     log("Testing Strategy Backtest...")
     try:
@@ -113,9 +116,9 @@ def verify_system():
             "end_date": "2025-12-31",
             "weights": {"ZNCO": 0.5, "SCBL": 0.5}
         }
-        resp = session.post(f"{BASE_URL}/backtest/run", json=payload)
+        resp = await client.post(f"{BASE_URL}/backtest/run", json=payload)
         if resp.status_code == 200:
-            data = resp.json()
+            data = jloads(resp)
             if "metrics" in data:
                 log(f"Backtest Successful. CAGR: {data['metrics']['cagr']}", "SUCCESS")
             else:
@@ -125,10 +128,11 @@ def verify_system():
     except Exception as e:
         log(f"Backtest Exception: {e}", "ERROR")
 
+async def check_pdf(client):
     # 7. Reporting (PDF)
     log("Testing PDF Generation...")
     try:
-        resp = session.get(f"{BASE_URL}/reports/market-summary")
+        resp = await client.get(f"{BASE_URL}/reports/market-summary")
         if resp.status_code == 200:
             if "application/pdf" in resp.headers.get("content-type", ""):
                  log(f"PDF Generated ({len(resp.content)} bytes)", "SUCCESS")
@@ -139,5 +143,33 @@ def verify_system():
     except Exception as e:
         log(f"PDF Exception: {e}", "ERROR")
 
+async def verify_system():
+    limits = httpx.Limits(max_keepalive_connections=10)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        # 1. Health Check
+        try:
+            resp = await client.get(f"http://localhost:8000/health")
+            if resp.status_code == 200:
+                log("Health Check Passed", "SUCCESS")
+            else:
+                log(f"Health Check Failed: {resp.status_code}", "ERROR")
+        except Exception as e:
+            pytest.fail(f"Health Check Connection Failed: {e}")
+
+        await login(client)
+
+        # Remaining probes only depend on the auth header, so run them concurrently
+        await asyncio.gather(
+            check_market_summary(client),
+            check_yield_curve(client),
+            check_capm(client),
+            check_backtest(client),
+            check_pdf(client),
+        )
+
+def test_system():
+    asyncio.run(verify_system())
+    assert not ERRORS, "\n".join(ERRORS)
+
 if __name__ == "__main__":
-    verify_system()
+    asyncio.run(verify_system())